@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import os
+import pickle
 import sys
+import zipfile
 from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-import h5py
-import meshio
 import numpy as np
 import re
 
+# h5py and meshio each drag in large C extensions; they are imported
+# lazily inside the readers so --help and argument errors stay fast.
+if TYPE_CHECKING:
+    import h5py
+    import meshio
+
 VOLUME_CELL_TYPES = {"tetra", "tetra4", "tet10", "tetra10"}
 TRIANGLE_CELL_TYPES = {"triangle", "triangle6"}
 DISPLACEMENT_DIRECTIONS = {"DX": 1, "DY": 2, "DZ": 3}
@@ -17,6 +25,62 @@ FORCE_DIRECTIONS = {"FX": 1, "FY": 2, "FZ": 3}
 # Output formatting helpers
 FLOAT_TOL = 1e-12
 
+# Pre-compiled .comm / MED parsing patterns (compiled once at import time).
+# The .comm grammar is ASCII, so the command file is read and matched as
+# bytes; only captured names are decoded.
+_MATERIAU_RE = re.compile(
+    rb"(\w+)\s*=\s*DEFI_MATERIAU\(\s*ELAS=_F\(\s*E=([0-9eE+.\-]+),\s*NU=([0-9eE+.\-]+)\)\s*\)",
+    re.DOTALL,
+)
+_GROUP_MA_RE = re.compile(rb"GROUP_MA\s*=\s*\((.*?)\)", re.DOTALL)
+_MATER_RE = re.compile(rb"MATER\s*=\s*\((.*?)\)", re.DOTALL)
+_TOUT_RE = re.compile(rb"TOUT\s*=\s*'OUI'|TOUT\s*=\s*\"OUI\"")
+_QUOTED_RE = re.compile(rb"'([^']+)'")
+_IDENT_RE = re.compile(rb"[A-Za-z_][A-Za-z0-9_]*")
+_COMPONENT_RES = {
+    name: re.compile(name.encode("ascii") + rb"\s*=\s*([0-9eE+.\-]+)")
+    for name in (*DISPLACEMENT_DIRECTIONS, *FORCE_DIRECTIONS)
+}
+_FAM_RE = re.compile(r"FAM_(-?\d+)_")
+
+# Optional numba JIT for the tag -> material remap; worthwhile on batch
+# workloads where the compile cost amortizes. Falls back to numpy. The
+# numba import is deferred to first use to keep startup fast.
+_remap_tags_jit = None
+_jit_probe_done = False
+
+
+def _get_remap_tags_jit():
+    global _remap_tags_jit, _jit_probe_done
+    if _jit_probe_done:
+        return _remap_tags_jit
+    _jit_probe_done = True
+
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _remap_tags(tags, sorted_ids, sorted_mats):  # pragma: no cover
+        out = np.empty(tags.size, dtype=np.int64)
+        for i in range(tags.size):
+            lo, hi = 0, sorted_ids.size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if sorted_ids[mid] < tags[i]:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo < sorted_ids.size and sorted_ids[lo] == tags[i]:
+                out[i] = sorted_mats[lo]
+            else:
+                out[i] = -1
+        return out
+
+    _remap_tags_jit = _remap_tags
+    return _remap_tags_jit
+
 
 def format_float(value: float) -> str:
     """Format floats without trailing zeros."""
@@ -59,6 +123,35 @@ def array_assignment(
     return f"{var_name} = np.array({literal}, dtype={dtype_str})"
 
 
+def _cached(path: Path, key: str, compute, enabled: bool = True):
+    """
+    Return compute(), memoized in a sidecar pickle next to `path`.
+
+    The cache is keyed on the source file's (mtime_ns, size) so edited
+    inputs are re-parsed; stale or unreadable caches fall back to compute().
+    """
+    if not enabled:
+        return compute()
+
+    stamp = path.stat()
+    stat_key = (stamp.st_mtime_ns, stamp.st_size)
+    cache_path = path.with_suffix(path.suffix + f".{key}.pkl")
+
+    try:
+        cached_key, value = pickle.loads(cache_path.read_bytes())
+        if cached_key == stat_key:
+            return value
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    value = compute()
+    try:
+        cache_path.write_bytes(pickle.dumps((stat_key, value)))
+    except OSError:
+        pass  # Caching is best-effort; a read-only input dir is fine.
+    return value
+
+
 def locate_case_files(input_dir: Path) -> tuple[Path, Path]:
     """
     Locate the first .comm and .med files in the target directory.
@@ -80,9 +173,119 @@ def locate_case_files(input_dir: Path) -> tuple[Path, Path]:
     return comm_files[0], med_files[0]
 
 
-def load_salome_mesh(med_path: Path) -> meshio.Mesh:
-    """Read a Salomé-Meca .med mesh using meshio."""
-    return meshio.read(med_path)
+class _CachedCellBlock(NamedTuple):
+    """Minimal stand-in for meshio.CellBlock reconstructed from the npz cache."""
+
+    type: str
+    data: np.ndarray
+
+
+class _CachedMesh(NamedTuple):
+    """Minimal stand-in for meshio.Mesh exposing points/cells/cell_data."""
+
+    points: np.ndarray
+    cells: list[_CachedCellBlock]
+    cell_data: dict[str, list[np.ndarray]]
+
+
+def _load_mesh_cache(cache_path: Path, stat_key: tuple[int, int]) -> _CachedMesh | None:
+    """Reconstruct a cached mesh from npz, or None if missing/stale/corrupt."""
+    try:
+        with np.load(cache_path) as data:
+            if tuple(data["stat_key"]) != stat_key:
+                return None
+            cells = [
+                _CachedCellBlock(str(cell_type), data[f"cell_{i}_data"])
+                for i, cell_type in enumerate(data["cell_types"])
+            ]
+            tags = [data[f"cell_{i}_tags"] for i in range(len(cells))]
+            return _CachedMesh(
+                points=data["points"], cells=cells, cell_data={"cell_tags": tags}
+            )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _write_mesh_cache(cache_path: Path, stat_key: tuple[int, int], mesh: meshio.Mesh) -> None:
+    """Store points, cell blocks and cell_tags so warm runs skip meshio."""
+    tag_lists = mesh.cell_data.get("cell_tags")
+    if tag_lists is None or len(tag_lists) != len(mesh.cells):
+        return  # Without aligned tags the cache could not serve downstream code.
+
+    payload: dict[str, np.ndarray] = {
+        "stat_key": np.asarray(stat_key, dtype=np.int64),
+        "points": np.asarray(mesh.points),
+        "cell_types": np.asarray([block.type for block in mesh.cells]),
+    }
+    for idx, (block, tags) in enumerate(zip(mesh.cells, tag_lists)):
+        payload[f"cell_{idx}_data"] = np.asarray(block.data)
+        payload[f"cell_{idx}_tags"] = np.asarray(tags)
+
+    try:
+        np.savez(cache_path, **payload)
+    except OSError:
+        pass  # Caching is best-effort; a read-only input dir is fine.
+
+
+def _read_med_tets(handle: h5py.File) -> _CachedMesh | None:
+    """
+    Read points, tetra connectivity and family tags straight from the MED
+    HDF5 layout, skipping meshio's per-block object construction.
+
+    Only covers the single-mesh, tetra-bearing layout written by
+    Salomé-Meca; returns None otherwise so callers fall back to meshio.
+    Triangle blocks are not read, so this path is unsuitable when
+    boundary groups are needed.
+    """
+    ens_maa = handle.get("ENS_MAA")
+    if ens_maa is None or len(ens_maa) != 1:
+        return None
+    mesh_group = next(iter(ens_maa.values()))
+    step = next(iter(mesh_group.values()), None)
+    if step is None:
+        return None
+
+    coo = step.get("NOE/COO")
+    nod = step.get("MAI/TE4/NOD")
+    fam = step.get("MAI/TE4/FAM")
+    if coo is None or nod is None or fam is None:
+        return None
+
+    # MED stores coordinates and connectivity flat in component-major
+    # (Fortran) order; the reshapes below are views over the read buffer.
+    points = coo[...].reshape(-1, 3, order="F")
+    conn = nod[...].reshape(-1, 4, order="F") - 1  # MED node ids are 1-based
+    tags = fam[...]
+    return _CachedMesh(
+        points=points,
+        cells=[_CachedCellBlock("tetra", conn)],
+        cell_data={"cell_tags": [tags]},
+    )
+
+
+def load_salome_mesh(med_path: Path, use_cache: bool = True) -> meshio.Mesh | _CachedMesh:
+    """
+    Read a Salomé-Meca .med mesh using meshio.
+
+    On the first successful read the points, cell blocks and cell tags
+    are stored in a sidecar .npz; later runs on an unchanged .med file
+    load the arrays directly and bypass meshio's MED parsing entirely.
+    """
+    stamp = med_path.stat()
+    stat_key = (stamp.st_mtime_ns, stamp.st_size)
+    cache_path = med_path.with_suffix(med_path.suffix + ".mesh.npz")
+
+    if use_cache:
+        cached = _load_mesh_cache(cache_path, stat_key)
+        if cached is not None:
+            return cached
+
+    import meshio
+
+    mesh = meshio.read(med_path)
+    if use_cache:
+        _write_mesh_cache(cache_path, stat_key, mesh)
+    return mesh
 
 
 def build_cli_parser() -> argparse.ArgumentParser:
@@ -93,12 +296,22 @@ def build_cli_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "med_path",
         type=Path,
-        help="Path to the MED mesh file exported from Salomé-Meca.",
+        help=(
+            "Path to the MED mesh file exported from Salomé-Meca, or a "
+            "directory of case directories for batch mode."
+        ),
     )
     parser.add_argument(
         "comm_path",
         type=Path,
-        help="Path to the matching Code_Aster .comm file.",
+        nargs="?",
+        help="Path to the matching Code_Aster .comm file (omit in batch mode).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes for batch mode (defaults to the core count).",
     )
     parser.add_argument(
         "-m",
@@ -112,6 +325,11 @@ def build_cli_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include boundary data (pdof + nodf) in the generated Python file.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the sidecar .pkl caches for parsed .comm and MED metadata.",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -121,86 +339,75 @@ def build_cli_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def parse_materials(comm_text: str) -> list[tuple[str, float, float]]:
+def parse_materials(comm_text: bytes) -> list[tuple[str, float, float]]:
     """Extract (name, E, NU) tuples from the Code_Aster command file."""
-    pattern = re.compile(
-        r"(\w+)\s*=\s*DEFI_MATERIAU\(\s*ELAS=_F\(\s*E=([0-9eE+.\-]+),\s*NU=([0-9eE+.\-]+)\)\s*\)",
-        re.DOTALL,
-    )
-    matches = pattern.findall(comm_text)
+    matches = _MATERIAU_RE.findall(comm_text)
     if not matches:
         raise ValueError("No DEFI_MATERIAU blocks found in .comm file.")
 
-    return [(name, float(E), float(nu)) for name, E, nu in matches]
+    return [
+        (name.decode("ascii"), float(E.decode("ascii")), float(nu.decode("ascii")))
+        for name, E, nu in matches
+    ]
 
 
-def extract_function_body(text: str, func_name: str) -> str:
+def extract_function_body(text: bytes, func_name: str) -> bytes:
     """Return the inner text of func_name(...) handling nested parentheses."""
-    target = f"{func_name}("
+    target = func_name.encode("ascii") + b"("
     start = text.find(target)
     if start == -1:
         raise ValueError(f"{func_name} call not found in .comm file.")
 
-    idx = start + len(target)
-    depth = 1
-    body_chars: list[str] = []
-
-    while idx < len(text) and depth > 0:
-        char = text[idx]
-        if char == "(":
-            depth += 1
-        elif char == ")":
-            depth -= 1
-        if depth > 0:
-            body_chars.append(char)
-        idx += 1
-
-    if depth != 0:
+    try:
+        body, _ = _extract_parenthesized(text, start + len(target))
+    except ValueError:
         raise ValueError(f"Unbalanced parentheses while parsing {func_name}.")
+    return body
 
-    return "".join(body_chars)
 
+def _extract_parenthesized(text: bytes, start_idx: int) -> tuple[bytes, int]:
+    """Return substring inside parentheses starting from start_idx.
 
-def _extract_parenthesized(text: str, start_idx: int) -> tuple[str, int]:
-    """Return substring inside parentheses starting from start_idx."""
+    Scans with bytes.find to jump between parentheses (a C-level memchr)
+    instead of stepping through every character in Python.
+    """
     depth = 1
-    chars: list[str] = []
     idx = start_idx
-
-    while idx < len(text) and depth > 0:
-        char = text[idx]
-        if char == "(":
+    find = text.find  # hoist the bound method out of the scan loop
+
+    while depth > 0:
+        next_open = find(b"(", idx)
+        next_close = find(b")", idx)
+        if next_close == -1:
+            raise ValueError("Unbalanced parentheses while parsing segment.")
+        if next_open != -1 and next_open < next_close:
             depth += 1
-        elif char == ")":
+            idx = next_open + 1
+        else:
             depth -= 1
-        if depth > 0:
-            chars.append(char)
-        idx += 1
-
-    if depth != 0:
-        raise ValueError("Unbalanced parentheses while parsing segment.")
+            idx = next_close + 1
 
-    return "".join(chars), idx
+    return text[start_idx : idx - 1], idx
 
 
-def _extract_f_blocks(text: str) -> list[str]:
+def _extract_f_blocks(text: bytes) -> list[bytes]:
     """Return the inner text of each `_F(...)` fragment."""
-    blocks: list[str] = []
+    blocks: list[bytes] = []
     search_pos = 0
     while True:
-        start = text.find("_F(", search_pos)
+        start = text.find(b"_F(", search_pos)
         if start == -1:
             break
-        body, end_idx = _extract_parenthesized(text, start + len("_F("))
+        body, end_idx = _extract_parenthesized(text, start + len(b"_F("))
         blocks.append(body)
         search_pos = end_idx
     return blocks
 
 
-def _extract_keyword_blocks(text: str, keyword: str) -> list[str]:
+def _extract_keyword_blocks(text: bytes, keyword: str) -> list[bytes]:
     """Return `_F(...)` fragments that follow `keyword=`."""
-    blocks: list[str] = []
-    token = f"{keyword}="
+    blocks: list[bytes] = []
+    token = keyword.encode("ascii") + b"="
     search_pos = 0
 
     while True:
@@ -208,19 +415,19 @@ def _extract_keyword_blocks(text: str, keyword: str) -> list[str]:
         if start == -1:
             break
         idx = start + len(token)
-        while idx < len(text) and text[idx].isspace():
+        while idx < len(text) and text[idx : idx + 1].isspace():
             idx += 1
-        if idx >= len(text) or not text.startswith("_F(", idx):
+        if idx >= len(text) or not text.startswith(b"_F(", idx):
             search_pos = idx
             continue
-        body, end_idx = _extract_parenthesized(text, idx + len("_F("))
+        body, end_idx = _extract_parenthesized(text, idx + len(b"_F("))
         blocks.append(body)
         search_pos = end_idx
 
     return blocks
 
 
-def parse_group_material_assignments(comm_text: str) -> dict[str, str]:
+def parse_group_material_assignments(comm_text: bytes) -> dict[str, str]:
     """
     Map mesh group names (GROUP_MA) to material names from AFFE_MATERIAU.
 
@@ -233,33 +440,31 @@ def parse_group_material_assignments(comm_text: str) -> dict[str, str]:
     mapping: dict[str, str] = {}
 
     for block in _extract_f_blocks(affe_body):
-        if "MATER" not in block:
+        if b"MATER" not in block:
             continue
 
-        mater_match = re.search(r"MATER\s*=\s*\((.*?)\)", block, re.DOTALL)
+        mater_match = _MATER_RE.search(block)
         mater_name_match = (
-            re.search(r"([A-Za-z_][A-Za-z0-9_]*)", mater_match.group(1))
-            if mater_match
-            else None
+            _IDENT_RE.search(mater_match.group(1)) if mater_match else None
         )
         if not mater_name_match:
             continue
-        mater_name = mater_name_match.group(1)
+        mater_name = mater_name_match.group(0).decode("ascii")
 
         # Group-specific assignment.
-        if "GROUP_MA" in block:
-            group_match = re.search(r"GROUP_MA\s*=\s*\((.*?)\)", block, re.DOTALL)
+        if b"GROUP_MA" in block:
+            group_match = _GROUP_MA_RE.search(block)
             if not group_match:
                 continue
-            group_names = re.findall(r"'([^']+)'", group_match.group(1))
+            group_names = _QUOTED_RE.findall(group_match.group(1))
             if not group_names:
                 continue
             for group in group_names:
-                mapping[group] = mater_name
+                mapping[group.decode("ascii")] = mater_name
             continue
 
         # Default assignment to whole mesh: TOUT='OUI'
-        tout_match = re.search(r"TOUT\s*=\s*'OUI'|TOUT\s*=\s*\"OUI\"", block)
+        tout_match = _TOUT_RE.search(block)
         if tout_match:
             mapping["__ALL__"] = mater_name
 
@@ -271,29 +476,43 @@ def parse_group_material_assignments(comm_text: str) -> dict[str, str]:
     return mapping
 
 
-def load_family_name_map(med_path: Path) -> dict[int, str]:
-    """Read MED family identifiers and their group names via h5py."""
+def load_family_name_map(med_source: Path | h5py.File) -> dict[int, str]:
+    """
+    Read MED family identifiers and their group names via h5py.
+
+    Accepts either a path or an already-open h5py.File so callers doing
+    several HDF5 reads can share one handle instead of paying the file
+    open/metadata cost per read.
+    """
+    import h5py
+
+    if not isinstance(med_source, h5py.File):
+        with h5py.File(med_source, "r") as handle:
+            return load_family_name_map(handle)
+
     mapping: dict[int, str] = {}
-    with h5py.File(med_path, "r") as handle:
-        eleme = handle.get("FAS/Mesh_1/ELEME")
-        if eleme is None:
-            return mapping
-
-        for fam_key in eleme.keys():
-            match = re.match(r"FAM_(-?\d+)_", fam_key)
-            if not match:
-                continue
-            family_id = int(match.group(1))
-            name_dataset = eleme[fam_key]["GRO"]["NOM"][...]
-            # Convert int8 array into ASCII string (stop at nulls).
-            chars = name_dataset[0]
-            group_name = "".join(chr(c) for c in chars if c != 0).strip()
-            mapping[family_id] = group_name
+    eleme = med_source.get("FAS/Mesh_1/ELEME")
+    if eleme is None:
+        return mapping
+
+    # Resolve each NOM dataset with a single path lookup and read only
+    # its first row, then decode all names in one batch afterwards.
+    rows: list[tuple[int, bytes]] = []
+    for fam_key in eleme.keys():
+        match = _FAM_RE.match(fam_key)
+        if not match:
+            continue
+        name_dataset = eleme[f"{fam_key}/GRO/NOM"]
+        rows.append((int(match.group(1)), bytes(name_dataset[0])))
+
+    for family_id, raw_name in rows:
+        # Convert raw bytes into ASCII string (stop at nulls).
+        mapping[family_id] = raw_name.partition(b"\x00")[0].decode("ascii").strip()
 
     return mapping
 
 
-def parse_ddl_impo_blocks(comm_text: str) -> list[dict[str, object]]:
+def parse_ddl_impo_blocks(comm_text: bytes) -> list[dict[str, object]]:
     """Parse DDL_IMPO entries from AFFE_CHAR_MECA."""
     try:
         body = extract_function_body(comm_text, "AFFE_CHAR_MECA")
@@ -302,18 +521,18 @@ def parse_ddl_impo_blocks(comm_text: str) -> list[dict[str, object]]:
     blocks: list[dict[str, object]] = []
 
     for chunk in _extract_keyword_blocks(body, "DDL_IMPO"):
-        group_match = re.search(r"GROUP_MA\s*=\s*\((.*?)\)", chunk, re.DOTALL)
+        group_match = _GROUP_MA_RE.search(chunk)
         if not group_match:
             continue
-        groups = re.findall(r"'([^']+)'", group_match.group(1))
+        groups = [g.decode("ascii") for g in _QUOTED_RE.findall(group_match.group(1))]
         if not groups:
             continue
 
         comps: dict[str, float] = {}
         for comp_name in DISPLACEMENT_DIRECTIONS:
-            comp_match = re.search(rf"{comp_name}\s*=\s*([0-9eE+.\-]+)", chunk)
+            comp_match = _COMPONENT_RES[comp_name].search(chunk)
             if comp_match:
-                comps[comp_name] = float(comp_match.group(1))
+                comps[comp_name] = float(comp_match.group(1).decode("ascii"))
 
         if not comps:
             continue
@@ -323,7 +542,7 @@ def parse_ddl_impo_blocks(comm_text: str) -> list[dict[str, object]]:
     return blocks
 
 
-def parse_force_face_blocks(comm_text: str) -> list[dict[str, object]]:
+def parse_force_face_blocks(comm_text: bytes) -> list[dict[str, object]]:
     """Parse FORCE_FACE entries from AFFE_CHAR_MECA."""
     try:
         body = extract_function_body(comm_text, "AFFE_CHAR_MECA")
@@ -332,18 +551,18 @@ def parse_force_face_blocks(comm_text: str) -> list[dict[str, object]]:
     blocks: list[dict[str, object]] = []
 
     for chunk in _extract_keyword_blocks(body, "FORCE_FACE"):
-        group_match = re.search(r"GROUP_MA\s*=\s*\((.*?)\)", chunk, re.DOTALL)
+        group_match = _GROUP_MA_RE.search(chunk)
         if not group_match:
             continue
-        groups = re.findall(r"'([^']+)'", group_match.group(1))
+        groups = [g.decode("ascii") for g in _QUOTED_RE.findall(group_match.group(1))]
         if not groups:
             continue
 
         comps: dict[str, float] = {}
         for comp_name in FORCE_DIRECTIONS:
-            comp_match = re.search(rf"{comp_name}\s*=\s*([0-9eE+.\-]+)", chunk)
+            comp_match = _COMPONENT_RES[comp_name].search(chunk)
             if comp_match:
-                comps[comp_name] = float(comp_match.group(1))
+                comps[comp_name] = float(comp_match.group(1).decode("ascii"))
 
         if not comps:
             continue
@@ -353,62 +572,109 @@ def parse_force_face_blocks(comm_text: str) -> list[dict[str, object]]:
     return blocks
 
 
-def locate_volume_block(mesh: meshio.Mesh) -> tuple[int, meshio.CellBlock]:
-    """Return the first volumetric cell block (tetrahedral)."""
+def _find_volume(mesh: meshio.Mesh) -> tuple[int, meshio.CellBlock, np.ndarray]:
+    """Locate the tetrahedral cell block and its per-element tags in one pass."""
+    tag_lists = mesh.cell_data.get("cell_tags")
+
     for idx, block in enumerate(mesh.cells):
-        if block.type in VOLUME_CELL_TYPES:
-            if block.data.shape[1] != 4:
-                raise ValueError(
-                    f"Expected 4-node tets, got {block.data.shape[1]} nodes per cell."
-                )
-            return idx, block
+        if block.type not in VOLUME_CELL_TYPES:
+            continue
+        if block.data.shape[1] != 4:
+            raise ValueError(
+                f"Expected 4-node tets, got {block.data.shape[1]} nodes per cell."
+            )
+
+        lists = tag_lists
+        if lists is None:
+            lists = next(
+                (dl for dl in mesh.cell_data.values() if idx < len(dl)), None
+            )
+        if lists is None or idx >= len(lists):
+            raise ValueError("No cell tags found for tetrahedral block.")
+        return idx, block, np.asarray(lists[idx], dtype=np.int32)
 
     raise ValueError("No tetrahedral cell block found in MED file.")
 
 
-def extract_cell_tags(mesh: meshio.Mesh, block_index: int) -> np.ndarray:
-    """Fetch per-element group identifiers matching the requested block."""
-    if "cell_tags" in mesh.cell_data:
-        tags = mesh.cell_data["cell_tags"][block_index]
-        return np.asarray(tags, dtype=int)
+class ElemArrays(NamedTuple):
+    """Element data in column (SoA) layout: type ids, material ids, connectivity."""
 
-    for data_list in mesh.cell_data.values():
-        if block_index < len(data_list):
-            tags = data_list[block_index]
-            return np.asarray(tags, dtype=int)
+    type_id: np.ndarray
+    mater_idx: np.ndarray
+    conn: np.ndarray
 
-    raise ValueError("No cell tags found for tetrahedral block.")
+    def to_elem_matrix(self) -> np.ndarray:
+        """Pack the columns into the legacy [type, mat, n1..n4] matrix."""
+        elem = np.empty((self.conn.shape[0], 6), dtype=np.int32)
+        elem[:, 0] = self.type_id
+        elem[:, 1] = self.mater_idx
+        elem[:, 2:] = self.conn
+        return elem
 
 
-def build_elem_matrix(
+def build_elem_arrays(
     mesh: meshio.Mesh, tag_to_material: dict[int, int] | None = None
-) -> np.ndarray:
-    """Create the elem matrix [type_id, material_or_tag, n1, n2, n3, n4]."""
-    block_index, block = locate_volume_block(mesh)
-    tags = extract_cell_tags(mesh, block_index)
+) -> ElemArrays:
+    """Create per-element type, material and 1-based connectivity arrays."""
+    _, block, tags = _find_volume(mesh)
 
-    connectivity = np.asarray(block.data, dtype=int) + 1  # convert to 1-based ids
+    connectivity = np.asarray(block.data)
     if connectivity.shape[0] != tags.shape[0]:
         raise ValueError("Mismatch between element tags and connectivity lengths.")
 
     if tag_to_material:
-        mapped_tags = np.full_like(tags, fill_value=-1, dtype=int)
-        for family_id, mat_idx in tag_to_material.items():
-            mapped_tags[tags == family_id] = mat_idx
-
-        if np.any(mapped_tags < 0):
+        remap_jit = _get_remap_tags_jit()
+        if remap_jit is not None:
+            fam_ids = np.fromiter(tag_to_material.keys(), dtype=np.int64, count=len(tag_to_material))
+            mat_vals = np.fromiter(tag_to_material.values(), dtype=np.int64, count=len(tag_to_material))
+            order = np.argsort(fam_ids)
+            mapped_tags = remap_jit(
+                np.ascontiguousarray(tags, dtype=np.int64),
+                fam_ids[order],
+                mat_vals[order],
+            )
             missing = np.unique(tags[mapped_tags < 0])
+        else:
+            # Remap only the K unique family ids (K << N) and expand via
+            # the inverse indices; missing ids fall out of the same pass.
+            uniq, inverse = np.unique(tags, return_inverse=True)
+            uniq_mapped = np.fromiter(
+                (tag_to_material.get(int(u), -1) for u in uniq),
+                dtype=np.int32,
+                count=len(uniq),
+            )
+            missing = uniq[uniq_mapped < 0]
+            mapped_tags = uniq_mapped[inverse]
+
+        if missing.size:
             raise ValueError(
                 f"No material mapping found for family ids: {', '.join(map(str, missing))}"
             )
     else:
         mapped_tags = tags
 
-    elem = np.empty((connectivity.shape[0], 6), dtype=int)
-    elem[:, 0] = 1  # element type id (tetra4)
-    elem[:, 1] = mapped_tags
-    elem[:, 2:] = connectivity
-    return elem
+    # int32 halves the bandwidth of every downstream scan; meshes with
+    # >2B nodes are out of scope for this tool.
+    if connectivity.size and int(connectivity.max()) >= np.iinfo(np.int32).max:
+        raise ValueError("Node ids exceed int32 range; mesh too large for this tool.")
+
+    # Write the 1-based node ids straight into conn, skipping the +1 temporary.
+    conn = np.empty(connectivity.shape, dtype=np.int32)
+    np.add(connectivity, 1, out=conn, casting="unsafe")
+
+    type_id = np.full(connectivity.shape[0], 1, dtype=np.uint8)  # tetra4
+    return ElemArrays(
+        type_id=type_id,
+        mater_idx=np.asarray(mapped_tags, dtype=np.int32),
+        conn=conn,
+    )
+
+
+def build_elem_matrix(
+    mesh: meshio.Mesh, tag_to_material: dict[int, int] | None = None
+) -> np.ndarray:
+    """Create the elem matrix [type_id, material_or_tag, n1, n2, n3, n4]."""
+    return build_elem_arrays(mesh, tag_to_material).to_elem_matrix()
 
 
 def build_tag_to_material_index(
@@ -641,24 +907,37 @@ def write_case_file(
 
     output_path.write_text("\n".join(lines))
     return output_path
-def main(argv: list[str] | None = None) -> None:
-    parser = build_cli_parser()
-    args = parser.parse_args(argv)
+def process_case(
+    med_path: Path,
+    comm_path: Path,
+    include_mater: bool,
+    include_boundary: bool,
+    use_cache: bool = True,
+    explicit_output: Path | None = None,
+) -> list[str]:
+    """Convert one .med/.comm pair and return the summary lines."""
 
-    med_path = args.med_path
-    comm_path = args.comm_path
+    def _read_family_map() -> dict[int, str]:
+        import h5py
 
-    if not med_path.is_file():
-        parser.error(f"MED file not found: {med_path}")
-    if not comm_path.is_file():
-        parser.error(f".comm file not found: {comm_path}")
+        # Open the MED file once for every h5py-level read.
+        with h5py.File(med_path, "r") as med_handle:
+            return load_family_name_map(med_handle)
 
-    include_mater = args.mater
-    include_boundary = args.boundary
+    family_map = _cached(med_path, "fams", _read_family_map, use_cache)
+
+    mesh: meshio.Mesh | _CachedMesh | None = None
+    if not include_boundary:
+        # Tetra-only fast path: boundary mode needs the triangle blocks,
+        # which only the meshio reader provides.
+        import h5py
 
-    family_map = load_family_name_map(med_path)
-    mesh = load_salome_mesh(med_path)
-    node = np.array(mesh.points, dtype=float)
+        with h5py.File(med_path, "r") as med_handle:
+            mesh = _read_med_tets(med_handle)
+    if mesh is None:
+        mesh = load_salome_mesh(med_path, use_cache)
+    # No-copy when points are already float64 and contiguous.
+    node = np.ascontiguousarray(mesh.points, dtype=np.float64)
 
     materials: list[tuple[str, float, float]] = []
     material_labels: list[str] = []
@@ -666,14 +945,25 @@ def main(argv: list[str] | None = None) -> None:
     tag_to_material: dict[int, int] | None = None
 
     if include_mater:
-        comm_text = comm_path.read_text()
-        materials = parse_materials(comm_text)
+        comm_text = comm_path.read_bytes()
+        materials = _cached(
+            comm_path, "mater", lambda: parse_materials(comm_text), use_cache
+        )
         material_labels = [name for name, _, _ in materials]
-        group_assignments = parse_group_material_assignments(comm_text)
+        group_assignments = _cached(
+            comm_path,
+            "groups",
+            lambda: parse_group_material_assignments(comm_text),
+            use_cache,
+        )
         tag_to_material = build_tag_to_material_index(family_map, materials, group_assignments)
-        mater = np.array([[E, nu] for _, E, nu in materials], dtype=float)
+        mater = np.fromiter(
+            (value for _, E, nu in materials for value in (E, nu)),
+            dtype=float,
+            count=2 * len(materials),
+        ).reshape(-1, 2)
     else:
-        comm_text = comm_path.read_text() if include_boundary else ""
+        comm_text = comm_path.read_bytes() if include_boundary else b""
 
     elem = build_elem_matrix(mesh, tag_to_material)
 
@@ -682,7 +972,7 @@ def main(argv: list[str] | None = None) -> None:
 
     if include_boundary:
         if not comm_text:
-            comm_text = comm_path.read_text()
+            comm_text = comm_path.read_bytes()
         group_nodes, triangle_groups = build_group_node_and_triangle_maps(mesh, family_map)
         ddl_blocks = parse_ddl_impo_blocks(comm_text)
         pdof = build_pdof_array(group_nodes, ddl_blocks)
@@ -699,25 +989,88 @@ def main(argv: list[str] | None = None) -> None:
         material_labels,
         include_mater,
         include_boundary,
-        args.output,
+        explicit_output,
     )
 
-    print(f"Found command file : {comm_path}")
-    print(f"Found mesh file    : {med_path}")
-    print(f"Mesh summary       : {len(mesh.points)} points, {len(mesh.cells)} cell blocks")
-    print(f"Node matrix shape  : {node.shape}")
-    print(f"Element matrix shape: {elem.shape}")
+    summary = [
+        f"Found command file : {comm_path}",
+        f"Found mesh file    : {med_path}",
+        f"Mesh summary       : {len(mesh.points)} points, {len(mesh.cells)} cell blocks",
+        f"Node matrix shape  : {node.shape}",
+        f"Element matrix shape: {elem.shape}",
+    ]
 
     if include_mater and mater is not None:
-        print(f"Material matrix shape: {mater.shape}")
+        summary.append(f"Material matrix shape: {mater.shape}")
         for (name, _, _), row in zip(materials, mater):
-            print(f"  {name}: E={row[0]}, nu={row[1]}")
+            summary.append(f"  {name}: E={row[0]}, nu={row[1]}")
 
     if include_boundary and pdof is not None and nodf is not None:
-        print(f"Prescribed DOF shape: {pdof.shape}")
-        print(f"Nodal load shape     : {nodf.shape}")
+        summary.append(f"Prescribed DOF shape: {pdof.shape}")
+        summary.append(f"Nodal load shape     : {nodf.shape}")
+
+    summary.append(f"Wrote case file      : {output_path}")
+    return summary
 
-    print(f"Wrote case file      : {output_path}")
+
+def _process_case_star(case_args) -> list[str]:
+    """Adapter so executor.map can fan out positional tuples."""
+    return process_case(*case_args)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_cli_parser()
+    args = parser.parse_args(argv)
+
+    med_path = args.med_path
+    comm_path = args.comm_path
+    include_mater = args.mater
+    include_boundary = args.boundary
+    use_cache = not args.no_cache
+
+    # Batch mode: a directory of case directories, each holding one
+    # .med/.comm pair. Cases are independent, so fan out across cores.
+    if med_path.is_dir():
+        if comm_path is not None:
+            parser.error("Batch mode takes a single directory argument.")
+        if args.output is not None:
+            parser.error("-o/--output is not supported in batch mode.")
+
+        case_dirs = sorted(p for p in med_path.iterdir() if p.is_dir())
+        if not case_dirs:
+            parser.error(f"No case directories found inside '{med_path}'.")
+
+        pairs = [locate_case_files(case_dir) for case_dir in case_dirs]
+        case_args = [
+            (case_med, case_comm, include_mater, include_boundary, use_cache)
+            for case_comm, case_med in pairs
+        ]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        max_workers = args.jobs or min(len(case_args), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for summary in executor.map(_process_case_star, case_args):
+                print("\n".join(summary))
+                print()
+        return
+
+    if comm_path is None:
+        parser.error("A .comm file is required unless a batch directory is given.")
+    if not med_path.is_file():
+        parser.error(f"MED file not found: {med_path}")
+    if not comm_path.is_file():
+        parser.error(f".comm file not found: {comm_path}")
+
+    summary = process_case(
+        med_path,
+        comm_path,
+        include_mater,
+        include_boundary,
+        use_cache,
+        args.output,
+    )
+    print("\n".join(summary))
 
 
 if __name__ == "__main__":